@@ -1,21 +1,69 @@
-from flask import Flask, request, jsonify, render_template
-import pandas as pd
+from flask import Flask, request, render_template
+import csv
 import numpy as np
-from forecast_model import AgriYieldForecaster
+from forecast_model import AgriYieldForecaster, FEATURE_ROW_COLUMNS
 from weather_api import get_current_weather
+import functools
+import json
 import os
+import time
+
+# orjson serializes responses several times faster than the stdlib json
+# module and understands numpy scalars; fall back to json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
 # near other imports
 from utils import (
-    get_irrigation_recommendation,
-    suggest_crop_cycle,
-    format_prediction_summary,
-    generate_farming_tips,
+    build_prediction_response,
     validate_input_parameters
 )
 
 
 app = Flask(__name__)
 
+# Defaults for /predict features, in FEATURE_ROW_COLUMNS order
+_FEATURE_DEFAULTS = np.array([0, 0, 0, 7, 25, 0, 50], dtype=np.float32)
+
+
+def _dumps(payload):
+    """Serialize a payload with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload)
+
+
+def _json_response(payload, status=200):
+    """Build a JSON Response without going through flask.jsonify"""
+    return app.response_class(_dumps(payload), status=status, mimetype='application/json')
+
+
+@functools.lru_cache(maxsize=1)
+def _load_soil_data():
+    """Parse the state soil CSV once and index it for O(1) lookups"""
+    # utf-8-sig strips the BOM the data file starts with
+    with open('data/state_soil_data.csv', newline='', encoding='utf-8-sig') as f:
+        lookup = {
+            row['state']: {
+                'N': float(row['N']),
+                'P': float(row['P']),
+                'K': float(row['K']),
+                'pH': float(row['pH'])
+            }
+            for row in csv.DictReader(f)
+        }
+    return sorted(lookup), lookup
+
+
+# Cache the soil data in memory at startup - it is a small static file,
+# so there is no reason to re-read it on every request
+try:
+    _STATES, _SOIL_LOOKUP = _load_soil_data()
+except Exception as e:
+    print(f"Error loading soil data: {e}")
+    _STATES, _SOIL_LOOKUP = [], {}
+
 # Initialize the forecaster
 forecaster = AgriYieldForecaster()
 
@@ -30,6 +78,63 @@ try:
 except Exception as e:
     print(f"Error loading model: {e}")
 
+# Warm up the hot paths at import so the first real request does not pay
+# first-call costs (model dispatch, JIT compilation of the weather
+# kernel). Under gunicorn --preload this runs once in the master.
+if model_loaded:
+    try:
+        forecaster.predict_row(_STATES[0] if _STATES else '', _FEATURE_DEFAULTS.copy())
+    except Exception as e:
+        print(f"Model warmup failed: {e}")
+try:
+    get_current_weather(_STATES[0] if _STATES else 'Punjab')
+except Exception as e:
+    print(f"Weather warmup failed: {e}")
+
+# /states and /health payloads never change after boot, so pay the JSON
+# serialization cost once here instead of on every request
+_STATES_RESPONSE_BODY = _dumps({'states': _STATES, 'success': True})
+_HEALTH_RESPONSE_BODY = _dumps({
+    'status': 'healthy',
+    'model_loaded': model_loaded,
+    'success': True
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _soil_response(state):
+    """Serialize the soil payload for a state once and reuse the body"""
+    soil_info = _SOIL_LOOKUP.get(state)
+    if soil_info is None:
+        body = _dumps({
+            'error': f'No soil data found for state: {state}',
+            'success': False
+        })
+        return body, 404
+    return _dumps({'soil_data': soil_info, 'success': True}), 200
+
+
+# Weather readings change on the order of minutes, so the serialized
+# /weather payload is cached per state for a short TTL
+_WEATHER_CACHE_TTL_SECONDS = 300
+
+
+@functools.lru_cache(maxsize=64)
+def _weather_response_cached(state, ttl_bucket):
+    """Serialize the weather payload for a state once per TTL window"""
+    return _dumps({'weather_data': get_current_weather(state), 'success': True})
+
+
+def _weather_response_body(state):
+    """Serialize the weather payload for a state, reused until the TTL expires
+
+    The bucket index rolls over every TTL window so entries expire, and
+    lru_cache bounds the cache at 64 states - the state segment is
+    user-controlled, so an unbounded dict would grow on garbage URLs.
+    """
+    return _weather_response_cached(state, int(time.monotonic() // _WEATHER_CACHE_TTL_SECONDS))
+
+
 @app.route('/')
 def index():
     """Render the main dashboard"""
@@ -40,71 +145,87 @@ def predict_yield():
     """Predict crop yield and return recommendations."""
     try:
         if not model_loaded:
-            return jsonify({'error': 'Model not loaded. Please train the model first.', 'success': False})
+            return _json_response({'error': 'Model not loaded. Please train the model first.', 'success': False})
 
         data = request.json or {}
         
         # Validate required fields quickly (use your util validation)
         validation = validate_input_parameters(data)
         if not validation['success']:
-            return jsonify({'error': 'Invalid input', 'details': validation['errors'], 'success': False})
-
-        # Build input_data dict (ensure numeric types)
-        input_data = {
-            'state': data.get('state', ''),
-            'N': float(data.get('N', 0)),
-            'P': float(data.get('P', 0)),
-            'K': float(data.get('K', 0)),
-            'pH': float(data.get('pH', 7)),
-            'avg_temp_c': float(data.get('avg_temp_c', 25)),
-            'total_rainfall_mm': float(data.get('total_rainfall_mm', 0)),
-            'avg_humidity_percent': float(data.get('avg_humidity_percent', 50))
-        }
-        if 'year' in data:
-            input_data['year'] = int(data['year'])
+            return _json_response({'error': 'Invalid input', 'details': validation['errors'], 'success': False})
+
+        # Parse features straight into a preallocated numeric row;
+        # defaults fill any gaps
+        row = _FEATURE_DEFAULTS.copy()
+        for i, key in enumerate(FEATURE_ROW_COLUMNS):
+            value = data.get(key)
+            if value is not None:
+                row[i] = float(value)
+
+        state = data.get('state', '')
+        year = int(data['year']) if 'year' in data else None
 
         # Predict
-        prediction_raw = forecaster.predict(input_data)
+        prediction_raw = forecaster.predict_row(state, row, year=year)
         prediction = round(float(prediction_raw), 2)
 
-        # Create the formatted summary (uses utils)
-        summary = format_prediction_summary(prediction, input_data)
+        # Build the full structured response in one pass over the row
+        return _json_response(build_prediction_response(prediction, row))
+
+    except ValueError as e:
+        return _json_response({'error': f'Invalid input data: {str(e)}', 'success': False})
+    except Exception as e:
+        return _json_response({'error': f'Prediction error: {str(e)}', 'success': False})
 
-        # Farming tips (friendly list)
-        farming_tips = generate_farming_tips(
-            {'N': input_data['N'], 'P': input_data['P'], 'K': input_data['K'], 'pH': input_data['pH']},
-            {'avg_temp_c': input_data['avg_temp_c'], 'total_rainfall_mm': input_data['total_rainfall_mm'], 'avg_humidity_percent': input_data['avg_humidity_percent']}
-        )
 
-        # Return structured response (friendly for frontend)
-        return jsonify({
+@app.route('/predict-batch', methods=['POST'])
+def predict_yield_batch():
+    """Predict crop yield for many sites with a single model call."""
+    try:
+        if not model_loaded:
+            return _json_response({'error': 'Model not loaded. Please train the model first.', 'success': False})
+
+        data = request.json or {}
+        rows = data.get('rows')
+        if not isinstance(rows, list) or not rows:
+            return _json_response({'error': 'Request must include a non-empty "rows" list', 'success': False})
+
+        # Validate every row up front so one model call covers them all
+        for index, row in enumerate(rows):
+            validation = validate_input_parameters(row)
+            if not validation['success']:
+                return _json_response({
+                    'error': f'Invalid input in row {index}',
+                    'details': validation['errors'],
+                    'success': False
+                })
+
+        predictions = forecaster.predict_batch(rows)
+
+        return _json_response({
             'success': True,
-            'prediction': prediction,
-            'yield_category': summary.get('yield_category'),
-            'irrigation': summary.get('irrigation_advice'),
-            'crop_cycle': summary.get('crop_cycle'),
-            'soil_health': summary.get('soil_health'),
-            'weather_risks': summary.get('weather_risks'),
-            'farming_tips': farming_tips
+            'count': len(rows),
+            'predictions': [round(float(p), 2) for p in predictions]
         })
 
     except ValueError as e:
-        return jsonify({'error': f'Invalid input data: {str(e)}', 'success': False})
+        return _json_response({'error': f'Invalid input data: {str(e)}', 'success': False})
     except Exception as e:
-        return jsonify({'error': f'Prediction error: {str(e)}', 'success': False})
+        return _json_response({'error': f'Prediction error: {str(e)}', 'success': False})
 
 
 @app.route('/weather/<state>')
 def get_weather_data(state):
     """Get weather data for a specific state"""
     try:
-        weather_data = get_current_weather(state)
-        return jsonify({
-            'weather_data': weather_data,
-            'success': True
-        })
+        # ?nocache=1 bypasses the TTL cache (useful when testing)
+        if request.args.get('nocache'):
+            body = _dumps({'weather_data': get_current_weather(state), 'success': True})
+        else:
+            body = _weather_response_body(state)
+        return app.response_class(body, mimetype='application/json')
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'error': f'Weather data error: {str(e)}',
             'success': False
         })
@@ -112,57 +233,21 @@ def get_weather_data(state):
 @app.route('/states')
 def get_states():
     """Get list of available states"""
-    try:
-        # Read soil data to get available states
-        soil_data = pd.read_csv('data/state_soil_data.csv')
-        states = sorted(soil_data['state'].unique().tolist())
-        return jsonify({
-            'states': states,
-            'success': True
-        })
-    except Exception as e:
-        return jsonify({
-            'error': f'Error loading states: {str(e)}',
-            'success': False
-        })
+    # Served straight from the body serialized at startup
+    return app.response_class(_STATES_RESPONSE_BODY, mimetype='application/json')
 
 @app.route('/soil-data/<state>')
 def get_soil_data(state):
     """Get soil data for a specific state"""
-    try:
-        soil_data = pd.read_csv('data/state_soil_data.csv')
-        state_soil = soil_data[soil_data['state'] == state]
-        
-        if state_soil.empty:
-            return jsonify({
-                'error': f'No soil data found for state: {state}',
-                'success': False
-            })
-        
-        soil_info = {
-            'N': float(state_soil['N'].iloc[0]),
-            'P': float(state_soil['P'].iloc[0]),
-            'K': float(state_soil['K'].iloc[0]),
-            'pH': float(state_soil['pH'].iloc[0])
-        }
-        
-        return jsonify({
-            'soil_data': soil_info,
-            'success': True
-        })
-    
-    except Exception as e:
-        return jsonify({
-            'error': f'Error loading soil data: {str(e)}',
-            'success': False
-        })
+    body, status = _soil_response(state)
+    return app.response_class(body, status=status, mimetype='application/json')
 
 @app.route('/model-info')
 def get_model_info():
     """Get information about the loaded model"""
     try:
         if not model_loaded:
-            return jsonify({
+            return _json_response({
                 'error': 'No model loaded',
                 'success': False
             })
@@ -173,13 +258,13 @@ def get_model_info():
             'model_loaded': model_loaded
         }
         
-        return jsonify({
+        return _json_response({
             'model_info': model_info,
             'success': True
         })
     
     except Exception as e:
-        return jsonify({
+        return _json_response({
             'error': f'Error getting model info: {str(e)}',
             'success': False
         })
@@ -187,22 +272,18 @@ def get_model_info():
 @app.route('/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'model_loaded': model_loaded,
-        'success': True
-    })
+    return app.response_class(_HEALTH_RESPONSE_BODY, mimetype='application/json')
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
+    return _json_response({
         'error': 'Endpoint not found',
         'success': False
     }), 404
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
+    return _json_response({
         'error': 'Internal server error',
         'success': False
     }), 500
@@ -0,0 +1,45 @@
+"""
+Ahead-of-time build script for the mock weather kernels
+
+numba's @njit pays an LLVM compilation pause on the first call in each
+fresh process (reduced but not removed by cache=True). Compiling the
+kernels once with numba.pycc produces a regular extension module, so
+runtime processes get native-speed kernels with no JIT pause and no
+numba dependency at all.
+
+Build once at CI / image build time (needs numba<0.61 - pycc was
+removed in numba 0.61):
+    pip install -r requirements-build.txt
+    python build_weather_ext.py
+
+weather_api.py picks up the resulting weather_ext module automatically
+and falls back to the JIT / pure-Python versions when it is absent.
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC('weather_ext')
+
+
+# The bounds are spelled out as literals here because AOT modules are
+# compiled standalone and cannot capture globals from weather_api
+@cc.export('perturb', 'f8[:](f8, f8, f8, i8)')
+def perturb(temp, rainfall, humidity, seed):
+    """Seeded perturbation of a (temp, rainfall, humidity) reading, clamped"""
+    np.random.seed(seed)
+    values = np.empty(3)
+    values[0] = min(max(temp + np.random.uniform(-2, 2), 0.0), 50.0)
+    values[1] = max(rainfall + np.random.uniform(-100, 100), 0.0)
+    values[2] = min(max(humidity + np.random.uniform(-5, 5), 10.0), 100.0)
+    return values
+
+
+@cc.export('validate', 'b1(f8, f8, f8)')
+def validate(temp, rainfall, humidity):
+    """Range-check a weather reading against realistic bounds for India"""
+    return (-10 <= temp <= 55) and (0 <= rainfall <= 5000) and (10 <= humidity <= 100)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -33,6 +33,9 @@ import joblib
 import os
 from pathlib import Path
 
+# Canonical column order for the compact feature-row prediction path
+FEATURE_ROW_COLUMNS = ('N', 'P', 'K', 'pH', 'avg_temp_c', 'total_rainfall_mm', 'avg_humidity_percent')
+
 class AgriYieldForecaster:
     def __init__(self):
         self.model = None
@@ -253,11 +256,11 @@ class AgriYieldForecaster:
         # Apply label encoding for categorical variables
         for col in self.label_encoders:
             if col in input_data.columns:
-                # Handle unseen categories by using the most frequent class
-                try:
-                    input_data[col] = self.label_encoders[col].transform(input_data[col])
-                except ValueError:
-                    input_data[col] = 0  # Default to first class for unseen categories
+                # Map each value individually so an unseen category only
+                # defaults its own row to the first class - a whole-column
+                # transform would zero every row in a batch on one bad value
+                class_index = {cls: i for i, cls in enumerate(self.label_encoders[col].classes_)}
+                input_data[col] = [class_index.get(value, 0) for value in input_data[col]]
         
         # Scale features
         input_scaled = self.scaler.transform(input_data)
@@ -267,6 +270,29 @@ class AgriYieldForecaster:
         
         return prediction[0] if len(prediction) == 1 else prediction
 
+    def predict_row(self, state, row, year=None):
+        """Make a prediction from a numeric feature row in FEATURE_ROW_COLUMNS order"""
+        # Go straight from the array to a single-row frame - no
+        # intermediate per-field dict
+        input_data = pd.DataFrame([row], columns=list(FEATURE_ROW_COLUMNS))
+        input_data['state'] = state
+        if year is not None:
+            input_data['year'] = year
+
+        return self.predict(input_data)
+
+    def predict_batch(self, rows):
+        """Make predictions for many input rows with a single model call"""
+        if self.model is None:
+            raise ValueError("Model not trained or loaded")
+
+        # Build one frame so encoding, scaling and tree traversal are
+        # amortized across all rows instead of paid per row
+        input_data = pd.DataFrame(rows)
+        predictions = self.predict(input_data)
+
+        return np.atleast_1d(predictions)
+
 
 def main():
     """Main function to train and save the model"""
@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for production deployment
+
+The app is I/O bound (blocking outbound weather API calls), so threaded
+workers let those requests overlap instead of serializing behind the
+single-threaded Flask dev server. preload_app imports app.py once in the
+master process, so the trained model and the soil-data cache are loaded
+a single time and shared with workers via copy-on-write.
+
+Run with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = 'gthread'
+threads = 5
+preload_app = True
@@ -5,6 +5,7 @@ This module contains helper functions for agricultural predictions and recommend
 Extracted from app.py to keep the main application clean and modular.
 """
 
+import functools
 from typing import Dict, List, Optional
 
 
@@ -327,98 +328,161 @@ def get_yield_category(yield_value: float) -> str:
         return "Excellent Yield"
 
 
-def validate_input_parameters(data: Dict) -> Dict:
+# Fields checked by validate_input_parameters, in canonical order
+_VALIDATED_FIELDS = ('N', 'P', 'K', 'pH', 'avg_temp_c', 'total_rainfall_mm', 'avg_humidity_percent')
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_field_values(values: tuple) -> tuple:
     """
-    Validate input parameters for prediction
-    
+    Run the required-field and range checks on a canonical value tuple
+
+    Cached so identical inputs (repeated form submissions, batch rows
+    sharing soil defaults) skip the float conversions and range checks.
+
     Args:
-        data (dict): Input parameters
-    
+        values (tuple): Values in _VALIDATED_FIELDS order, None if missing
+
     Returns:
-        dict: Validation result with success status and errors if any
+        tuple: Error messages, empty if all checks pass
     """
     errors = []
-    
+
     # Check required fields
-    required_fields = ['N', 'P', 'K', 'pH', 'avg_temp_c', 'total_rainfall_mm', 'avg_humidity_percent']
-    for field in required_fields:
-        if field not in data or data[field] is None:
+    for field, value in zip(_VALIDATED_FIELDS, values):
+        if value is None:
             errors.append(f"Missing required field: {field}")
-    
+
+    n, p, k, ph, temp, rainfall, humidity = values
+
     try:
         # Validate ranges
-        if 'N' in data and (float(data['N']) < 0 or float(data['N']) > 1000):
+        if n is not None and (float(n) < 0 or float(n) > 1000):
             errors.append("Nitrogen value should be between 0-1000 mg/kg")
-        
-        if 'P' in data and (float(data['P']) < 0 or float(data['P']) > 200):
+
+        if p is not None and (float(p) < 0 or float(p) > 200):
             errors.append("Phosphorus value should be between 0-200 mg/kg")
-        
-        if 'K' in data and (float(data['K']) < 0 or float(data['K']) > 1000):
+
+        if k is not None and (float(k) < 0 or float(k) > 1000):
             errors.append("Potassium value should be between 0-1000 mg/kg")
-        
-        if 'pH' in data and (float(data['pH']) < 0 or float(data['pH']) > 14):
+
+        if ph is not None and (float(ph) < 0 or float(ph) > 14):
             errors.append("pH value should be between 0-14")
-        
-        if 'avg_temp_c' in data and (float(data['avg_temp_c']) < -10 or float(data['avg_temp_c']) > 60):
+
+        if temp is not None and (float(temp) < -10 or float(temp) > 60):
             errors.append("Temperature should be between -10°C to 60°C")
-        
-        if 'total_rainfall_mm' in data and (float(data['total_rainfall_mm']) < 0 or float(data['total_rainfall_mm']) > 5000):
+
+        if rainfall is not None and (float(rainfall) < 0 or float(rainfall) > 5000):
             errors.append("Rainfall should be between 0-5000 mm")
-        
-        if 'avg_humidity_percent' in data and (float(data['avg_humidity_percent']) < 0 or float(data['avg_humidity_percent']) > 100):
+
+        if humidity is not None and (float(humidity) < 0 or float(humidity) > 100):
             errors.append("Humidity should be between 0-100%")
-    
-    except ValueError as e:
+
+    except ValueError:
         errors.append("Invalid numeric values provided")
-    
-    return {
-        'success': len(errors) == 0,
-        'errors': errors
-    }
 
+    return tuple(errors)
 
-def generate_farming_tips(soil_data: Dict, weather_data: Dict) -> List[str]:
+
+def validate_input_parameters(data: Dict) -> Dict:
     """
-    Generate personalized farming tips based on soil and weather conditions
-    
+    Validate input parameters for prediction
+
     Args:
-        soil_data (dict): Soil parameter data
-        weather_data (dict): Weather condition data
-    
+        data (dict): Input parameters
+
     Returns:
-        list: List of farming tips
+        dict: Validation result with success status and errors if any
     """
+    values = tuple(data.get(field) for field in _VALIDATED_FIELDS)
+
+    try:
+        errors = _validate_field_values(values)
+    except TypeError:
+        # Unhashable values cannot be cached; validate directly
+        errors = _validate_field_values.__wrapped__(values)
+
+    return {
+        'success': len(errors) == 0,
+        'errors': list(errors)
+    }
+
+
+def _farming_tips_from_values(n: float, ph: float, temp: float, rainfall: float, humidity: float) -> List[str]:
+    """Generate the farming tip list from plain scalar conditions"""
     tips = []
-    
+
     # Soil-based tips
-    n_level = float(soil_data.get('N', 200))
-    p_level = float(soil_data.get('P', 30))
-    k_level = float(soil_data.get('K', 200))
-    ph_level = float(soil_data.get('pH', 7))
-    
-    if n_level < 200:
+    if n < 200:
         tips.append("🌿 Consider organic nitrogen sources like compost or vermicompost for sustainable soil improvement")
-    
-    if ph_level < 6.0:
+
+    if ph < 6.0:
         tips.append("🧪 Apply agricultural lime 2-3 months before planting to improve soil pH")
-    elif ph_level > 8.0:
+    elif ph > 8.0:
         tips.append("🧪 Add organic matter or sulfur to reduce soil alkalinity")
-    
+
     # Weather-based tips
-    temp = float(weather_data.get('avg_temp_c', 25))
-    rainfall = float(weather_data.get('total_rainfall_mm', 1000))
-    humidity = float(weather_data.get('avg_humidity_percent', 65))
-    
     if temp > 32 and humidity > 75:
         tips.append("🦠 High temperature and humidity favor disease development - ensure good field ventilation")
-    
+
     if rainfall < 700:
         tips.append("💧 Consider drought-tolerant crop varieties and water-efficient irrigation methods")
     elif rainfall > 1800:
         tips.append("🌊 Ensure adequate drainage and consider raised bed cultivation")
-    
+
     # General tips
     tips.append("📅 Plan crop rotation to maintain soil health and reduce pest buildup")
     tips.append("🌱 Use certified seeds and follow recommended spacing for optimal yield")
-    
-    return tips
\ No newline at end of file
+
+    return tips
+
+
+def generate_farming_tips(soil_data: Dict, weather_data: Dict) -> List[str]:
+    """
+    Generate personalized farming tips based on soil and weather conditions
+
+    Args:
+        soil_data (dict): Soil parameter data
+        weather_data (dict): Weather condition data
+
+    Returns:
+        list: List of farming tips
+    """
+    return _farming_tips_from_values(
+        float(soil_data.get('N', 200)),
+        float(soil_data.get('pH', 7)),
+        float(weather_data.get('avg_temp_c', 25)),
+        float(weather_data.get('total_rainfall_mm', 1000)),
+        float(weather_data.get('avg_humidity_percent', 65))
+    )
+
+
+def build_prediction_response(prediction: float, feats) -> Dict:
+    """
+    Build the full /predict response payload in a single pass
+
+    Fuses format_prediction_summary and generate_farming_tips: the
+    feature row is unpacked once and every recommendation helper is fed
+    plain scalars, with no intermediate summary or parameter dicts.
+
+    Args:
+        prediction (float): Predicted yield value
+        feats: Numeric feature row in forecast_model.FEATURE_ROW_COLUMNS
+            order (N, P, K, pH, avg_temp_c, total_rainfall_mm,
+            avg_humidity_percent)
+
+    Returns:
+        dict: Response payload ready to serialize
+    """
+    n, p, k, ph, temp, rainfall, humidity = (float(value) for value in feats)
+
+    return {
+        'success': True,
+        'prediction': prediction,
+        'yield_category': get_yield_category(prediction),
+        'irrigation': get_irrigation_recommendation(rainfall),
+        'crop_cycle': suggest_crop_cycle(temp, rainfall),
+        'soil_health': get_soil_health_assessment(n, p, k, ph),
+        'weather_risks': get_weather_risk_assessment(temp, rainfall, humidity),
+        'farming_tips': _farming_tips_from_values(n, ph, temp, rainfall, humidity)
+    }
\ No newline at end of file
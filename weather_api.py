@@ -10,12 +10,37 @@ Supported integrations (to be implemented):
 - AccuWeather API
 """
 
+import functools
 import requests
 import json
-import random
+import threading
+import time
+import numpy as np
 from datetime import datetime
+from requests.adapters import HTTPAdapter, Retry
 from typing import Dict, Optional
 
+# Numba is optional: when available the perturbation math below is
+# JIT-compiled, otherwise the plain Python version is used as-is
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# orjson parses API responses several times faster than the stdlib
+# json module; fall back to response.json() when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prebuilt AOT kernels (see build_weather_ext.py): when present they
+# replace the JIT / pure-Python variants below with zero startup cost
+try:
+    import weather_ext
+except ImportError:
+    weather_ext = None
+
 # Mock weather data for development
 MOCK_WEATHER_DATA = {
     'Andhra Pradesh': {'temp': 28.5, 'rainfall': 850, 'humidity': 68},
@@ -50,6 +75,51 @@ MOCK_WEATHER_DATA = {
     'West Bengal': {'temp': 25.8, 'rainfall': 1550, 'humidity': 74}
 }
 
+# Structure-of-arrays view of MOCK_WEATHER_DATA: one index lookup plus
+# three contiguous float reads per query instead of nested dict lookups
+# and a per-call .copy()
+_STATE_IDX = {state: i for i, state in enumerate(MOCK_WEATHER_DATA)}
+_BASE_TEMP = np.array([v['temp'] for v in MOCK_WEATHER_DATA.values()], dtype=np.float32)
+_BASE_RAIN = np.array([v['rainfall'] for v in MOCK_WEATHER_DATA.values()], dtype=np.float32)
+_BASE_HUM = np.array([v['humidity'] for v in MOCK_WEATHER_DATA.values()], dtype=np.float32)
+
+# Default values if state not found
+_DEFAULT_BASE = (25.0, 1000.0, 65.0)
+
+# Realistic bounds for (temperature, rainfall, humidity) readings,
+# shared by every clamp site
+_LOWER = np.array([0.0, 0.0, 10.0])
+_UPPER = np.array([50.0, np.inf, 100.0])
+
+# Per-thread RNG: numpy's default_rng draws faster than the random
+# module and avoids races on shared generator state under threaded
+# workers
+_rng_local = threading.local()
+
+
+def _rng() -> np.random.Generator:
+    """Return this thread's random Generator, creating it on first use"""
+    generator = getattr(_rng_local, 'generator', None)
+    if generator is None:
+        generator = np.random.default_rng()
+        _rng_local.generator = generator
+    return generator
+
+# Shared HTTP session: reuses TCP/TLS connections across API calls
+# instead of paying a fresh handshake on every request
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# Real weather changes on the order of minutes, so API responses are
+# cached for a short TTL
+_API_CACHE_TTL_SECONDS = 600
+
 def get_current_weather(state: str, api_key: Optional[str] = None, use_mock: bool = True) -> Dict:
     """
     Fetch current weather data for a given state
@@ -69,55 +139,172 @@ def get_current_weather(state: str, api_key: Optional[str] = None, use_mock: boo
         # In production, replace with actual API call
         return get_openweather_data(state, api_key)
 
+def _perturb(temp: float, rainfall: float, humidity: float, seed: int) -> tuple:
+    """
+    Apply the seeded perturbation to a base reading and clamp the result
+
+    Args:
+        temp (float): Base temperature in Celsius
+        rainfall (float): Base rainfall in mm
+        humidity (float): Base humidity percentage
+        seed (int): Seed for the predictable time-based variation
+
+    Returns:
+        tuple: (temperature, rainfall, humidity) within realistic bounds
+    """
+    # A fresh seeded Generator keeps the draw deterministic per time
+    # slot without touching process-wide legacy np.random state
+    rng = np.random.default_rng(seed)
+    values = np.empty(3)
+    values[0] = temp + rng.uniform(-2, 2)
+    values[1] = rainfall + rng.uniform(-100, 100)
+    values[2] = humidity + rng.uniform(-5, 5)
+
+    # Ensure realistic bounds
+    np.clip(values, _LOWER, _UPPER, out=values)
+
+    return values[0], values[1], values[2]
+
+
+if njit is not None:
+    # njit only supports the legacy np.random API, whose state numba
+    # keeps per thread, so seeding inside the kernel stays race-free.
+    # cache=True persists the compiled kernel so later processes skip
+    # the LLVM compilation cost.
+    @njit(cache=True)
+    def _perturb(temp, rainfall, humidity, seed):
+        np.random.seed(seed)
+        values = np.empty(3)
+        values[0] = temp + np.random.uniform(-2, 2)
+        values[1] = rainfall + np.random.uniform(-100, 100)
+        values[2] = humidity + np.random.uniform(-5, 5)
+        np.clip(values, _LOWER, _UPPER, out=values)
+        return values[0], values[1], values[2]
+
+
+if weather_ext is not None:
+    # Same math compiled ahead of time: no first-call JIT pause and no
+    # numba needed in the runtime image
+    def _perturb(temp, rainfall, humidity, seed):
+        values = weather_ext.perturb(temp, rainfall, humidity, seed)
+        return values[0], values[1], values[2]
+
+@functools.lru_cache(maxsize=2048)
+def _mock_weather_cached(state: str, day: int, hour: int) -> tuple:
+    """
+    Compute the perturbed mock reading for a (state, day, hour) slot
+
+    The seeded randomness already makes readings constant within an hour,
+    so the RNG, rounding and clamping only need to run once per slot.
+
+    Args:
+        state (str): Name of the state
+        day (int): Day of month used to seed the variation
+        hour (int): Hour of day used to seed the variation
+
+    Returns:
+        tuple: (temperature, rainfall, humidity) within realistic bounds
+    """
+
+    # Get base data for the state
+    idx = _STATE_IDX.get(state, -1)
+    if idx < 0:
+        base_temp, base_rain, base_hum = _DEFAULT_BASE
+    else:
+        base_temp, base_rain, base_hum = _BASE_TEMP[idx], _BASE_RAIN[idx], _BASE_HUM[idx]
+
+    # Add some randomness to simulate real-time variation,
+    # seeded from the time slot so readings stay predictable
+    temp, rainfall, humidity = _perturb(
+        float(base_temp), float(base_rain), float(base_hum), day + hour
+    )
+
+    return round(temp, 1), round(rainfall, 1), round(humidity, 1)
+
 def get_mock_weather(state: str) -> Dict:
     """
     Generate mock weather data for development and testing
-    
+
     Args:
         state (str): Name of the state
-    
+
     Returns:
         Dict: Mock weather data
     """
-    
-    # Get base data for the state
-    if state in MOCK_WEATHER_DATA:
-        base_data = MOCK_WEATHER_DATA[state].copy()
-    else:
-        # Default values if state not found
-        base_data = {'temp': 25.0, 'rainfall': 1000, 'humidity': 65}
-    
-    # Add some randomness to simulate real-time variation
+
     current_time = datetime.now()
-    random.seed(current_time.day + current_time.hour)  # Predictable randomness based on time
-    
-    weather_data = {
-        'avg_temp_c': round(base_data['temp'] + random.uniform(-2, 2), 1),
-        'total_rainfall_mm': round(base_data['rainfall'] + random.uniform(-100, 100), 1),
-        'avg_humidity_percent': round(base_data['humidity'] + random.uniform(-5, 5), 1),
+    temp, rainfall, humidity = _mock_weather_cached(state, current_time.day, current_time.hour)
+
+    return {
+        'avg_temp_c': temp,
+        'total_rainfall_mm': rainfall,
+        'avg_humidity_percent': humidity,
         'timestamp': current_time.isoformat(),
         'source': 'mock_data',
         'state': state
     }
-    
-    # Ensure realistic bounds
-    weather_data['avg_temp_c'] = max(0, min(50, weather_data['avg_temp_c']))
-    weather_data['total_rainfall_mm'] = max(0, weather_data['total_rainfall_mm'])
-    weather_data['avg_humidity_percent'] = max(10, min(100, weather_data['avg_humidity_percent']))
-    
-    return weather_data
+
+@functools.lru_cache(maxsize=64)
+def _fetch_openweather(state: str, api_key: str, ttl_bucket: int) -> Dict:
+    """
+    Fetch and parse one OpenWeather response, cached per TTL window
+
+    Keyed on (state, api_key, bucket): the bucket index rolls over every
+    TTL window so entries expire, and lru_cache bounds the cache at 64
+    entries with LRU eviction - the state name comes from the caller, so
+    an unbounded dict could grow without limit. Failures raise out of
+    the cache, so errors are never stored.
+
+    Args:
+        state (str): Name of the state
+        api_key (str): OpenWeatherMap API key
+        ttl_bucket (int): Current TTL window index
+
+    Returns:
+        Dict: Parsed weather data from OpenWeatherMap
+    """
+
+    # OpenWeatherMap API endpoint
+    base_url = "http://api.openweathermap.org/data/2.5/weather"
+
+    # Parameters for the API call
+    params = {
+        'q': f"{state},IN",  # Assuming Indian states
+        'appid': api_key,
+        'units': 'metric'
+    }
+
+    # Make API request over the pooled session
+    response = _SESSION.get(base_url, params=params, timeout=10)
+    response.raise_for_status()
+
+    if orjson is not None:
+        data = orjson.loads(response.content)
+    else:
+        data = response.json()
+
+    # Extract relevant weather information
+    main = data['main']
+    return {
+        'avg_temp_c': main['temp'],
+        'total_rainfall_mm': data.get('rain', {}).get('1h', 0) * 24,  # Convert hourly to daily estimate
+        'avg_humidity_percent': main['humidity'],
+        'timestamp': datetime.now().isoformat(),
+        'source': 'openweathermap',
+        'state': state
+    }
 
 def get_openweather_data(state: str, api_key: str) -> Dict:
     """
     Fetch weather data from OpenWeatherMap API
-    
+
     Args:
         state (str): Name of the state
         api_key (str): OpenWeatherMap API key
-    
+
     Returns:
         Dict: Weather data from OpenWeatherMap
-    
+
     Note:
         This is a placeholder implementation. In production, you would:
         1. Get API key from environment variables
@@ -125,36 +312,12 @@ def get_openweather_data(state: str, api_key: str) -> Dict:
         3. Implement proper error handling and retries
         4. Cache results to avoid excessive API calls
     """
-    
+
     try:
-        # OpenWeatherMap API endpoint
-        base_url = "http://api.openweathermap.org/data/2.5/weather"
-        
-        # Parameters for the API call
-        params = {
-            'q': f"{state},IN",  # Assuming Indian states
-            'appid': api_key,
-            'units': 'metric'
-        }
-        
-        # Make API request
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract relevant weather information
-        weather_data = {
-            'avg_temp_c': data['main']['temp'],
-            'total_rainfall_mm': data.get('rain', {}).get('1h', 0) * 24,  # Convert hourly to daily estimate
-            'avg_humidity_percent': data['main']['humidity'],
-            'timestamp': datetime.now().isoformat(),
-            'source': 'openweathermap',
-            'state': state
-        }
-        
-        return weather_data
-        
+        # Serve recent responses from the cache - weather does not
+        # change per second and the API is rate limited
+        return _fetch_openweather(state, api_key, int(time.monotonic() // _API_CACHE_TTL_SECONDS))
+
     except requests.RequestException as e:
         print(f"API request failed: {e}")
         # Fallback to mock data
@@ -181,64 +344,90 @@ def get_weather_forecast(state: str, days: int = 7, api_key: Optional[str] = Non
     
     # For now, return mock forecast data
     current_weather = get_current_weather(state, api_key)
-    
-    forecast = {
+
+    # Generate the mock variation for all days in one batched draw:
+    # additive offsets for temperature/humidity, a multiplicative
+    # factor for rainfall
+    deltas = _rng().uniform([-3, 0.5, -10], [3, 1.5, 10], size=(days, 3))
+    values = np.empty_like(deltas)
+    values[:, 0] = current_weather['avg_temp_c'] + deltas[:, 0]
+    values[:, 1] = current_weather['total_rainfall_mm'] * deltas[:, 1]
+    values[:, 2] = current_weather['avg_humidity_percent'] + deltas[:, 2]
+
+    # Apply bounds
+    np.clip(values, _LOWER, _UPPER, out=values)
+
+    return {
         'state': state,
         'forecast_days': days,
-        'daily_forecast': []
+        'daily_forecast': [
+            {
+                'day': day + 1,
+                'avg_temp_c': temp,
+                'total_rainfall_mm': rainfall,
+                'avg_humidity_percent': humidity
+            }
+            for day, (temp, rainfall, humidity) in enumerate(values.tolist())
+        ]
     }
-    
-    # Generate mock forecast for each day
-    for day in range(days):
-        day_forecast = {
-            'day': day + 1,
-            'avg_temp_c': current_weather['avg_temp_c'] + random.uniform(-3, 3),
-            'total_rainfall_mm': current_weather['total_rainfall_mm'] * random.uniform(0.5, 1.5),
-            'avg_humidity_percent': current_weather['avg_humidity_percent'] + random.uniform(-10, 10)
-        }
-        
-        # Apply bounds
-        day_forecast['avg_temp_c'] = max(0, min(50, day_forecast['avg_temp_c']))
-        day_forecast['total_rainfall_mm'] = max(0, day_forecast['total_rainfall_mm'])
-        day_forecast['avg_humidity_percent'] = max(10, min(100, day_forecast['avg_humidity_percent']))
-        
-        forecast['daily_forecast'].append(day_forecast)
-    
-    return forecast
+
+@functools.lru_cache(maxsize=256)
+def _validate_values(temp: float, rainfall: float, humidity: float) -> bool:
+    """
+    Range-check a (temperature, rainfall, humidity) triple, cached by value
+
+    Args:
+        temp (float): Temperature in Celsius
+        rainfall (float): Rainfall in mm
+        humidity (float): Humidity percentage
+
+    Returns:
+        bool: True if all values are realistic, False otherwise
+    """
+
+    if not (-10 <= temp <= 55):  # Temperature range for India
+        return False
+
+    if not (0 <= rainfall <= 5000):  # Rainfall range
+        return False
+
+    if not (10 <= humidity <= 100):  # Humidity range
+        return False
+
+    return True
+
+
+if weather_ext is not None:
+    @functools.lru_cache(maxsize=256)
+    def _validate_values(temp: float, rainfall: float, humidity: float) -> bool:
+        """Range-check a reading via the AOT-compiled kernel, cached by value"""
+        return bool(weather_ext.validate(temp, rainfall, humidity))
 
 def validate_weather_data(weather_data: Dict) -> bool:
     """
     Validate weather data for completeness and realistic values
-    
+
     Args:
         weather_data (Dict): Weather data to validate
-    
+
     Returns:
         bool: True if data is valid, False otherwise
     """
-    
+
     required_fields = ['avg_temp_c', 'total_rainfall_mm', 'avg_humidity_percent']
-    
+
     # Check if all required fields are present
     for field in required_fields:
         if field not in weather_data:
             return False
-    
-    # Check if values are realistic
-    temp = weather_data['avg_temp_c']
-    rainfall = weather_data['total_rainfall_mm']
-    humidity = weather_data['avg_humidity_percent']
-    
-    if not (-10 <= temp <= 55):  # Temperature range for India
-        return False
-    
-    if not (0 <= rainfall <= 5000):  # Rainfall range
-        return False
-    
-    if not (10 <= humidity <= 100):  # Humidity range
-        return False
-    
-    return True
+
+    # Check if values are realistic (cached: mock readings repeat
+    # within an hour, so repeat triples cost one dict lookup)
+    return _validate_values(
+        weather_data['avg_temp_c'],
+        weather_data['total_rainfall_mm'],
+        weather_data['avg_humidity_percent']
+    )
 
 # Example usage and testing functions
 def main():